@@ -0,0 +1,369 @@
+import argparse
+import collections
+import configparser
+import ctypes
+import math
+import os
+import rtmidi
+import signal
+import threading
+import time
+import sys
+from typing import NamedTuple
+
+MIDI_CLOCK = 0xF8
+MIDI_START = 0xFA
+MIDI_STOP = 0xFC
+
+# Bound once so the hot callback does a module-global load instead of an
+# attribute lookup on the time module.
+perf_counter_ns = time.perf_counter_ns
+
+class RawMidiOut:
+    """Direct ALSA rawmidi output opened through ctypes.
+
+    Bypasses the rtmidi C++ layer for the 3-byte Note-Ons this script
+    emits: one snd_rawmidi_write call per buffer, no list marshalling.
+    Exposes the same send_message/close_port surface as rtmidi.MidiOut
+    so main() can use either interchangeably.
+    """
+
+    def __init__(self, device):
+        self._lib = ctypes.CDLL("libasound.so.2")
+        self._handle = ctypes.c_void_p()
+        err = self._lib.snd_rawmidi_open(None, ctypes.byref(self._handle),
+                                         device.encode(), 0)
+        if err < 0:
+            raise OSError(err, f"snd_rawmidi_open({device!r}) returned {err}")
+        self._write = self._lib.snd_rawmidi_write
+
+    def send_message(self, message):
+        self._write(self._handle, bytes(message), len(message))
+
+    def close_port(self):
+        self._lib.snd_rawmidi_close(self._handle)
+
+class Config(NamedTuple):
+    """Frozen run configuration, merged from CLI arguments and .ini file."""
+    in_port: str
+    out_port: str
+    raw_out: str
+    in_channel: int
+    out_channel: int
+    beats_per_bar: int
+    ticks_per_beat: int
+    note: int
+    notes_per_bar: int
+    note_bar_1: int
+    note_bar_2: int
+    note_bar_4: int
+    note_bar_8: int
+    note_bar_16: int
+    note_start: int
+    note_stop: int
+    show_bpm: bool
+
+def _boost_thread_priority():
+    """Ask for realtime scheduling for the calling thread, best effort.
+
+    rtmidi input callbacks run on whatever pool thread the OS provides,
+    at default priority; needs the rtprio rlimit (or root) on Linux.
+    """
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(80))
+    except (AttributeError, OSError):
+        pass
+
+def _bool(value):
+    return str(value).lower() in ("1", "true", "yes")
+
+# (option, caster) pairs driving the .ini override loop; one entry per
+# configurable option instead of one hand-written statement each.
+_CONFIG_SPEC = (
+    ("in_port", str), ("out_port", str), ("raw_out", str),
+    ("in_channel", int), ("out_channel", int),
+    ("beats_per_bar", int), ("ticks_per_beat", int),
+    ("note", int), ("notes_per_bar", int),
+    ("note_bar_1", int), ("note_bar_2", int), ("note_bar_4", int),
+    ("note_bar_8", int), ("note_bar_16", int),
+    ("note_start", int), ("note_stop", int),
+    ("show_bpm", _bool),
+)
+
+def iter_ports(midi_class):
+    for i in range(midi_class.get_port_count()):
+        yield i, midi_class.get_port_name(i)
+
+def list_ports(midi_class):
+    return [name for _, name in iter_ports(midi_class)]
+
+def find_port(midi_class, keyword):
+    if not keyword:
+        return None, None
+    keyword = keyword.lower()
+    for i, name in iter_ports(midi_class):
+        if keyword in name.lower():
+            return i, name
+    return None, None
+
+def parse_args_and_config():
+    parser = argparse.ArgumentParser(description="Convert MIDI Clock/Start/Stop to Note On messages.")
+    parser.add_argument("--in-port", help="Substring of MIDI input port name")
+    parser.add_argument("--out-port", help="Substring of MIDI output port name")
+    parser.add_argument("--raw-out", help="ALSA rawmidi device (e.g. hw:1,0) to write to directly, bypassing rtmidi output")
+
+    parser.add_argument("--in-channel", type=int, default=15, help="MIDI Channel used to receive Control Change messages from a central MIDI controller")
+    parser.add_argument("--out-channel", type=int, default=15, help="MIDI Channel used to send notes (15 by default)")
+
+    parser.add_argument("--beats-per-bar", type=int, default=4, help="Beats per bar (4 by default)")
+    parser.add_argument("--ticks-per-beat", type=int, default=1, help="Ticks per beat (default 1 = quarter)")
+
+    parser.add_argument("--note-bar-1", type=int, default=0, help="Note every bar")
+    parser.add_argument("--note-bar-2", type=int, default=0, help="Note every 2 bars")
+    parser.add_argument("--note-bar-4", type=int, default=0, help="Note every 4 bars")
+    parser.add_argument("--note-bar-8", type=int, default=0, help="Note every 8 bars")
+    parser.add_argument("--note-bar-16", type=int, default=0, help="Note every 16 bars")
+    
+    parser.add_argument("--note", type=int, default=60, help="The note to send is the option notes-per-bar is used")
+    parser.add_argument("--notes-per-bar", type=int, default=4, help="Note every XX bars (default note C3 each 4 bars)")
+    
+    parser.add_argument("--note-start", type=int, default=30, help="Note on MIDI Start")
+    parser.add_argument("--note-stop", type=int, default=31, help="Note on MIDI Stop")
+
+    parser.add_argument("--show-bpm", action="store_true", help="Display BPM from MIDI Clock")
+    parser.add_argument("--config", help="Path to .ini config file")
+
+    args = parser.parse_args()
+
+    if args.config:
+        config = configparser.ConfigParser()
+        config.read(args.config)
+        section = config["DEFAULT"]
+        for name, cast in _CONFIG_SPEC:
+            if cast is str:
+                # Port/device names given on the CLI win over the .ini.
+                setattr(args, name, getattr(args, name) or section.get(name))
+            else:
+                value = section.get(name)
+                if value is not None:
+                    setattr(args, name, cast(value))
+
+    return Config(**{field: getattr(args, field) for field in Config._fields})
+
+def main():
+    cfg = parse_args_and_config()
+    # Unpack the frozen config into locals: the hot closures below then
+    # read plain variables instead of doing attribute lookups per tick.
+    show_bpm = cfg.show_bpm
+    clocks_per_bar = cfg.ticks_per_beat * cfg.beats_per_bar
+
+    midi_in = rtmidi.MidiIn()
+    midi_out = rtmidi.MidiOut()
+
+    in_index, in_name = find_port(midi_in, cfg.in_port)
+    out_index, out_name = find_port(midi_out, cfg.out_port)
+
+    raw_out = None
+    if cfg.raw_out:
+        try:
+            raw_out = RawMidiOut(cfg.raw_out)
+        except OSError as exc:
+            print(f"⚠️ Raw MIDI device {cfg.raw_out} unavailable ({exc}); using rtmidi output.")
+
+    if in_index is None or (raw_out is None and out_index is None):
+        print("❌ MIDI input/output port not found.")
+        print("🔍 Available input ports:", list_ports(midi_in))
+        print("🔍 Available output ports:", list_ports(midi_out))
+        sys.exit(1)
+
+    midi_in.open_port(in_index)
+    # Enable reception of MIDI Clock
+    midi_in.ignore_types(timing=False)
+
+    if raw_out is None:
+        midi_out.open_port(out_index)
+    else:
+        midi_out = raw_out
+        out_name = cfg.raw_out
+
+    print(f"✅ Listening on: {in_name}")
+    print(f"✅ Sending to: {out_name}")
+    print("🎵 Notes: every bar = {}, every 2 = {}, every 4 = {}, every 8, every 16 = {}".format(
+        cfg.note_bar_1, cfg.note_bar_2, cfg.note_bar_4, cfg.note_bar_8, cfg.note_bar_16
+    ))
+    print("▶️ Start note = {}, ⏹ Stop note = {}".format(cfg.note_start, cfg.note_stop))
+    print("📈 BPM display: {}".format("On" if show_bpm else "Off"))
+
+    # Single-writer tick counter: the callback does one integer store
+    # per clock, and the BPM reporter thread samples it once a second.
+    tick_count = ctypes.c_uint64(0)
+
+    # SPSC ring between the rtmidi callback (producer) and the consumer
+    # thread: bounded deque append/popleft are thread-safe and O(1), so
+    # the producer only ever appends and the consumer only ever pops.
+    ring = collections.deque(maxlen=1024)
+    ring_ready = threading.Event()
+
+    # Count of Stops the producer has enqueued: when it runs ahead of
+    # the Stops the consumer has handled, a Stop is queued somewhere in
+    # the ring and the clock ticks in front of it must not fire notes.
+    stops_sent = [0]
+
+    print(f"ticks per beat = {cfg.ticks_per_beat}")
+    print(f"beats per bar  = {cfg.beats_per_bar}")
+    print(f"clocks per bar  = {clocks_per_bar}")
+
+    # Precompute, for every bar phase, a bitmask of which notes fire.
+    # The table period covers the 16-bar divisors and the notes-per-bar
+    # cycle, so the callback replaces six branches with one table lookup
+    # and a loop over set bits.
+    note_of_bit = (cfg.note, cfg.note_bar_1, cfg.note_bar_2,
+                   cfg.note_bar_4, cfg.note_bar_8, cfg.note_bar_16)
+    period = math.lcm(16, cfg.notes_per_bar) if cfg.notes_per_bar else 16
+    triggers = [0] * period
+    for i in range(period):
+        bar = i + 1
+        mask = 0
+        if cfg.note and cfg.notes_per_bar and bar % cfg.notes_per_bar == 0:
+            mask |= 1
+        for bit, divisor in enumerate((1, 2, 4, 8, 16), start=1):
+            if note_of_bit[bit] and bar % divisor == 0:
+                mask |= 1 << bit
+        triggers[i] = mask
+
+    # Channel, notes and velocity are fixed for the whole run, so the
+    # three-byte messages can be built once; the callback then only has
+    # to hand a prebuilt buffer to send_message, bound here as a local.
+    status = 0x90 | ((cfg.out_channel - 1) & 0x0F)
+    msg_of_bit = tuple(bytes((status, note, 100)) if note else None
+                       for note in note_of_bit)
+    msg_start = bytes((status, cfg.note_start, 100))
+    msg_stop = bytes((status, cfg.note_stop, 100))
+    send = midi_out.send_message
+
+    # Concatenate the Note-Ons of each bar phase into one buffer, so a
+    # bar boundary costs a single send_message call however many notes
+    # coincide on it. Phases with no notes store an empty buffer.
+    bunches = []
+    for mask in triggers:
+        batch = b""
+        while mask:
+            bit = mask & -mask
+            batch += msg_of_bit[bit.bit_length() - 1]
+            mask ^= bit
+        bunches.append(batch)
+
+
+    def midi_callback(event, data=None, _append=ring.append,
+                      _stops=stops_sent, _wake=ring_ready.set,
+                      _ticks=tick_count, _clock=MIDI_CLOCK,
+                      _stop=MIDI_STOP, _boosted=[False]):
+        # Runs on rtmidi's internal thread: count the tick and hand the
+        # status byte off, all real work happens on the consumer thread.
+        # Everything it touches is bound as a default parameter, so each
+        # read is a plain local instead of a closure cell or global.
+        if not _boosted[0]:
+            # First event: we are on rtmidi's thread now, so this is the
+            # only place its priority can be raised from.
+            _boosted[0] = True
+            _boost_thread_priority()
+        status = event[0][0]
+        if status == _clock:
+            _ticks.value += 1
+        elif status == _stop:
+            # Mark the cancellation point before enqueueing the Stop;
+            # the consumer discards the clocks queued in front of it.
+            _stops[0] += 1
+        _append(status)
+        _wake()
+
+    def consume():
+        # Countdown to the next bar and a wrapping phase index: both
+        # stay small bounded ints and need no modulo in the loop.
+        ticks_to_bar = clocks_per_bar
+        bar_phase = -1
+        stops_handled = 0
+
+        # Rebind the per-event lookups to locals once; the loop below
+        # then runs on function locals only.
+        pop = ring.popleft
+        wait = ring_ready.wait
+        clear = ring_ready.clear
+        clock, start, stop = MIDI_CLOCK, MIDI_START, MIDI_STOP
+
+        _boost_thread_priority()
+
+        while True:
+            wait()
+            clear()
+            while ring:
+                try:
+                    item = pop()
+                except IndexError:
+                    # The bounded deque can evict from our end when the
+                    # producer overflows it; never die on an empty pop.
+                    break
+
+                if item == clock:
+                    if stops_handled != stops_sent[0]:
+                        # A Stop is queued behind this tick: it arrived
+                        # after the tick and cancels its note.
+                        continue
+                    ticks_to_bar -= 1
+                    # Most ticks end here: only bar boundaries reach the
+                    # note-emission code below.
+                    if ticks_to_bar:
+                        continue
+                    ticks_to_bar = clocks_per_bar
+                    bar_phase += 1
+                    if bar_phase == period:
+                        bar_phase = 0
+                    batch = bunches[bar_phase]
+                    if batch:
+                        send(batch)
+
+                elif item == start:
+                    print("▶️ Start received")
+                    send(msg_start)
+
+                elif item == stop:
+                    stops_handled += 1
+                    print("⏹ Stop received")
+                    send(msg_stop)
+
+    threading.Thread(target=consume, daemon=True).start()
+    midi_in.set_callback(midi_callback)
+
+    print("🎶 Running... Press Ctrl+C to stop.")
+    stop_evt = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_evt.set())
+
+    if show_bpm:
+        # Only the BPM display needs periodic wakeups; without it the
+        # main thread sleeps until Ctrl+C. All arithmetic happens here
+        # on the cold side, from one counter sample per second.
+        def report_bpm():
+            last_ticks = tick_count.value
+            last_time = perf_counter_ns()
+            while not stop_evt.wait(1):
+                ticks = tick_count.value
+                now = perf_counter_ns()
+                elapsed = now - last_time
+                if elapsed > 0 and ticks != last_ticks:
+                    bpm = (ticks - last_ticks) * 60_000_000_000 / (24 * elapsed)
+                    print(f"BPM: {bpm:.2f}")
+                last_ticks, last_time = ticks, now
+        threading.Thread(target=report_bpm, daemon=True).start()
+
+    try:
+        # Waiting with a timeout keeps the loop interruptible on
+        # platforms where a bare Event.wait() delays signal delivery.
+        while not stop_evt.wait(timeout=3600):
+            pass
+        print("🛑 Exiting.")
+    finally:
+        midi_in.close_port()
+        midi_out.close_port()
+
+if __name__ == "__main__":
+    main()